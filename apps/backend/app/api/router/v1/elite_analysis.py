@@ -1,3 +1,4 @@
+import json
 import logging
 import traceback
 from uuid import uuid4
@@ -227,7 +228,7 @@ async def generate_progressive_feedback(
                 target_role=payload.target_role,
                 target_industry=payload.target_industry
             ):
-                yield f"data: {feedback_update}\n\n"
+                yield f"data: {json.dumps(feedback_update, separators=(',', ':'))}\n\n"
         
         return StreamingResponse(
             content=feedback_stream(),
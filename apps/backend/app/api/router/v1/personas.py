@@ -242,17 +242,17 @@ async def get_available_personas(db: Session = Depends(get_sync_db_session)):
     try:
         from ....services.persona_definitions import PersonaDefinitions
         
-        all_personas = PersonaDefinitions.get_all_personas()
+        persona_index = PersonaDefinitions.get_persona_index()
         
         personas_list = []
-        for persona_type, definition in all_personas.items():
+        for persona_type, entry in persona_index.items():
             personas_list.append({
                 "persona_type": persona_type,
-                "name": definition["name"],
-                "title": definition["title"],
-                "expertise_areas": definition["expertise_areas"][:3],  # Top 3 areas
-                "session_objectives": definition["session_objectives"][:3],  # Top 3 objectives
-                "communication_style": definition["personality_traits"]["communication_style"]
+                "name": entry["name"],
+                "title": entry["title"],
+                "expertise_areas": entry["expertise_areas"][:3],  # Top 3 areas
+                "session_objectives": entry["session_objectives"][:3],  # Top 3 objectives
+                "communication_style": entry["communication_style"]
             })
         
         return {
@@ -27,6 +27,9 @@ class Settings(BaseSettings):
     PYTHONDONTWRITEBYTECODE: int = 1
     ENV: str = "local"
     PORT: int = 8000
+    # Concurrent model prompts per worker from response quality analysis;
+    # keep at or below the Ollama server's OLLAMA_NUM_PARALLEL
+    AI_QUALITY_PARALLEL: int = 4
 
     model_config = SettingsConfigDict(
         env_file=os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, ".env"),
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -123,6 +123,8 @@ class CareerPersona(BaseModel):
 
 
 class ConversationResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     message: str
     phase: ConversationPhase
     questions: List[str] = Field(default_factory=list)
@@ -394,8 +394,8 @@ class CareerPsychologistService:
                 pass  # Continue with rule-based analysis
         
         return {
-            'strengths': list(set(strengths))[:10],  # Remove duplicates, limit to 10
-            'development_areas': list(set(development_areas))[:5],
+            'strengths': list(dict.fromkeys(strengths))[:10],  # Remove duplicates (keeping order), limit to 10
+            'development_areas': list(dict.fromkeys(development_areas))[:5],
             'ideal_environment': ideal_environment,
             'progression_style': progression_style
         }
@@ -1,6 +1,8 @@
 import uuid
 import re
-from typing import Optional, List, Dict, Any
+import asyncio
+import hashlib
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
 from sqlalchemy.orm import Session
@@ -12,6 +14,110 @@ from ..schemas.pydantic.conversation import (
     CARExperience, RESTMetrics, WorkExperienceData, FollowUpStrategy,
     IntelligenceScores, PersonalityProfile, ResumeSummary
 )
+from .ttl_cache import TTLCache
+
+
+class TurnAnalysisCache(TTLCache):
+    """Bounded LRU cache with TTL for per-turn input analysis results"""
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0):
+        super().__init__(maxsize, ttl)
+
+    @staticmethod
+    def make_key(phase: str, user_input: str) -> Tuple[str, bytes]:
+        """Key on the phase plus a short digest of the normalized input"""
+        digest = hashlib.blake2b(user_input.strip().encode(), digest_size=8).digest()
+        return phase, digest
+
+
+# Shared across builder instances; a builder is created per request
+_turn_analysis_cache = TurnAnalysisCache()
+
+# Target role keywords and their canonical titles, longest keyword first so
+# the first hit is also the most specific one
+_TARGET_ROLES_SORTED: Tuple[Tuple[str, str], ...] = tuple(sorted({
+    'software engineer': 'Software Engineer',
+    'product manager': 'Product Manager',
+    'data scientist': 'Data Scientist',
+    'marketing manager': 'Marketing Manager',
+    'business analyst': 'Business Analyst',
+    'project manager': 'Project Manager',
+    'consultant': 'Consultant',
+    'designer': 'Designer',
+    'developer': 'Developer'
+}.items(), key=lambda item: -len(item[0])))
+_MIN_TARGET_ROLE_LENGTH = len(_TARGET_ROLES_SORTED[-1][0])
+
+_SYNTHESIS_MESSAGE_TEMPLATE = """🚀 **ROCKET Launch Complete, {name}!**
+
+I now have rich material to create your bulletproof resume. Based on our conversation, I can see you're a {role_identity} with unique strengths.
+
+**Your ROCKET-Powered Resume Summary:**
+**{title}**
+
+{bullets}
+
+**ROCKET Framework Scores:**
+- Story Coherence: {coherence_score:.1%}
+- Achievement Quantification: {quantification_score:.1%}
+
+Your resume is now optimized using the ROCKET Framework! 🚀
+
+**Next Steps:**
+1. Review and refine any bullets above
+2. Add skills and education details
+3. Export your final resume
+
+Is there anything you'd like to adjust in your resume summary?"""
+
+# Personal story patterns, matched against lowercased text
+_ROLE_IDENTITY_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"i'm (?:a |an |the )?([^,\.\n]+?)(?:who|that|with)",
+    r"(?:i am|i'm) (?:a |an |the )?([^,\.\n]+)",
+    r"as (?:a |an |the )?([^,\.\n]+)"
+))
+_VALUE_PROPOSITION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r"help(?:s?|ing)?\s+(?:companies?|organizations?|teams?)\s+([^,\.\n]+)",
+    r"(?:achieve|deliver|drive|create)\s+([^,\.\n]+)",
+    r"specialize(?:s?|ing)?\s+in\s+([^,\.\n]+)"
+))
+
+# Conversation templates, built once at import
+_PHASE_QUESTIONS: Dict[ConversationPhase, Tuple[str, ...]] = {
+    ConversationPhase.INTRODUCTION: (
+        "What role are you targeting, and what drew you to this field?",
+        "In one sentence: I'm the _______ who can help companies _______"
+    ),
+    ConversationPhase.STORY_DISCOVERY: (
+        "Tell me about a time when you made a significant impact at work. What was the situation?",
+        "What's the one thing you want hiring managers to remember about you?",
+        "Describe a challenge you faced that showcased your unique abilities."
+    ),
+    ConversationPhase.ACHIEVEMENT_MINING: (
+        "Let's unpack this achievement. What was the context or challenge?",
+        "What specific actions did you take?",
+        "What was the measurable outcome?",
+        "How did this impact the business?"
+    )
+}
+
+_FOLLOW_UP_TEMPLATES: Dict[FollowUpStrategy, Tuple[str, ...]] = {
+    FollowUpStrategy.QUANTIFICATION_PROBE: (
+        "Great! Can you put some numbers to that impact?",
+        "What was the measurable result of this achievement?",
+        "How would you quantify the success of this initiative?"
+    ),
+    FollowUpStrategy.CONFIDENCE_BOOST: (
+        "I sense you're underselling yourself. What was the bigger picture result?",
+        "You were clearly instrumental in this success. What was your specific contribution?",
+        "Don't be modest - what was the full impact you created?"
+    ),
+    FollowUpStrategy.CLARIFICATION: (
+        "Can you be more specific about the scope of this project?",
+        "Help me understand the exact details of what you accomplished.",
+        "What were the concrete outcomes of your work?"
+    )
+}
 
 
 class ROCKETFramework:
@@ -23,29 +129,17 @@ class ROCKETFramework:
         combined_text = " ".join(responses).lower()
         
         # Extract role identity
-        role_patterns = [
-            r"i'm (?:a |an |the )?([^,\.\n]+?)(?:who|that|with)",
-            r"(?:i am|i'm) (?:a |an |the )?([^,\.\n]+)",
-            r"as (?:a |an |the )?([^,\.\n]+)"
-        ]
-        
         role_identity = None
-        for pattern in role_patterns:
-            match = re.search(pattern, combined_text)
+        for pattern in _ROLE_IDENTITY_PATTERNS:
+            match = pattern.search(combined_text)
             if match:
                 role_identity = match.group(1).strip()
                 break
         
         # Extract value proposition
-        value_patterns = [
-            r"help(?:s?|ing)?\s+(?:companies?|organizations?|teams?)\s+([^,\.\n]+)",
-            r"(?:achieve|deliver|drive|create)\s+([^,\.\n]+)",
-            r"specialize(?:s?|ing)?\s+in\s+([^,\.\n]+)"
-        ]
-        
         value_proposition = None
-        for pattern in value_patterns:
-            match = re.search(pattern, combined_text)
+        for pattern in _VALUE_PROPOSITION_PATTERNS:
+            match = pattern.search(combined_text)
             if match:
                 value_proposition = match.group(1).strip()
                 break
@@ -75,6 +169,8 @@ class ROCKETFramework:
         """Extract CAR (Context-Action-Results) from experience description"""
         # Simple NLP extraction - in production, use advanced NLP models
         sentences = experience_text.split('.')
+        # Lowercase once; '.' is unaffected by lower() so the split stays aligned
+        sentences_lower = experience_text.lower().split('.')
         
         context = ""
         action = ""
@@ -85,8 +181,7 @@ class ROCKETFramework:
         action_indicators = ["implemented", "led", "developed", "created", "managed", "optimized"]
         result_indicators = ["result", "impact", "outcome", "achieved", "increased", "decreased", "improved"]
         
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
+        for sentence, sentence_lower in zip(sentences, sentences_lower):
             if any(indicator in sentence_lower for indicator in context_indicators) and not context:
                 context = sentence.strip()
             elif any(indicator in sentence_lower for indicator in action_indicators) and not action:
@@ -187,14 +282,15 @@ class IntelligentFollowUp:
     def analyze_response_quality(response: str) -> FollowUpStrategy:
         """Determine if response needs deeper probing"""
         
+        response_lower = response.lower()
         quality_indicators = {
             "has_numbers": bool(re.search(r'\d+', response)),
             "specific_details": len(response.split()) > 20,
-            "business_impact": any(word in response.lower() for word in 
+            "business_impact": any(word in response_lower for word in 
                                   ['revenue', 'cost', 'efficiency', 'growth', 'roi', 'profit']),
-            "modesty_indicators": any(phrase in response.lower() for phrase in 
+            "modesty_indicators": any(phrase in response_lower for phrase in 
                                     ['helped', 'assisted', 'contributed', 'supported']),
-            "vague_language": any(phrase in response.lower() for phrase in 
+            "vague_language": any(phrase in response_lower for phrase in 
                                 ['some', 'a few', 'several', 'many', 'various'])
         }
         
@@ -218,42 +314,9 @@ class ConversationalResumeBuilder:
         self.rocket_framework = ROCKETFramework()
         self.follow_up_system = IntelligentFollowUp()
         
-        # Conversation templates
-        self.phase_questions = {
-            ConversationPhase.INTRODUCTION: [
-                "What role are you targeting, and what drew you to this field?",
-                "In one sentence: I'm the _______ who can help companies _______"
-            ],
-            ConversationPhase.STORY_DISCOVERY: [
-                "Tell me about a time when you made a significant impact at work. What was the situation?",
-                "What's the one thing you want hiring managers to remember about you?",
-                "Describe a challenge you faced that showcased your unique abilities."
-            ],
-            ConversationPhase.ACHIEVEMENT_MINING: [
-                "Let's unpack this achievement. What was the context or challenge?",
-                "What specific actions did you take?",
-                "What was the measurable outcome?",
-                "How did this impact the business?"
-            ]
-        }
-        
-        self.follow_up_templates = {
-            FollowUpStrategy.QUANTIFICATION_PROBE: [
-                "Great! Can you put some numbers to that impact?",
-                "What was the measurable result of this achievement?",
-                "How would you quantify the success of this initiative?"
-            ],
-            FollowUpStrategy.CONFIDENCE_BOOST: [
-                "I sense you're underselling yourself. What was the bigger picture result?",
-                "You were clearly instrumental in this success. What was your specific contribution?",
-                "Don't be modest - what was the full impact you created?"
-            ],
-            FollowUpStrategy.CLARIFICATION: [
-                "Can you be more specific about the scope of this project?",
-                "Help me understand the exact details of what you accomplished.",
-                "What were the concrete outcomes of your work?"
-            ]
-        }
+        # Conversation templates (shared, read-only)
+        self.phase_questions = _PHASE_QUESTIONS
+        self.follow_up_templates = _FOLLOW_UP_TEMPLATES
     
     async def initiate_conversation(self, user_id: Optional[str] = None) -> ConversationResponse:
         """Start conversation with ROCKET Framework introduction"""
@@ -264,7 +327,7 @@ class ConversationalResumeBuilder:
             id=session_id,
             user_id=user_id,
             current_phase=ConversationPhase.INTRODUCTION,
-            conversation_state={}
+            conversation_state={"user_messages": []}
         )
         
         # Create career profile
@@ -304,10 +367,10 @@ Let's ROCKET your career! What role are you targeting?"""
         self.db.add(initial_message)
         self.db.commit()
         
-        return ConversationResponse(
+        return ConversationResponse.model_construct(
             message=welcome_message,
             phase=ConversationPhase.INTRODUCTION,
-            questions=self.phase_questions[ConversationPhase.INTRODUCTION],
+            questions=list(self.phase_questions[ConversationPhase.INTRODUCTION]),
             session_id=session_id,
             progress_percentage=10.0
         )
@@ -333,6 +396,7 @@ Let's ROCKET your career! What role are you targeting?"""
             message_metadata={"phase": session.current_phase.value}
         )
         self.db.add(user_message)
+        self._record_user_message(session, user_input)
         
         # Process based on current phase
         if session.current_phase == ConversationPhase.INTRODUCTION:
@@ -388,7 +452,7 @@ Tell me about your most significant professional achievement. I want to understa
 
 *Be specific with numbers, timelines, and outcomes. This will form the foundation of your compelling resume story.* 🎯"""
 
-        return ConversationResponse(
+        return ConversationResponse.model_construct(
             message=response_message,
             phase=ConversationPhase.STORY_DISCOVERY,
             progress_percentage=25.0,
@@ -399,12 +463,8 @@ Tell me about your most significant professional achievement. I want to understa
                                            profile: UserCareerProfile, user_input: str) -> ConversationResponse:
         """Process story discovery with intelligent follow-up"""
         
-        # Analyze response quality
-        follow_up_strategy = self.follow_up_system.analyze_response_quality(user_input)
-        
-        # Extract CAR structure
-        car_experience = self.rocket_framework.extract_car_structure(user_input)
-        rest_metrics = self.rocket_framework.extract_rest_metrics(user_input)
+        # Analyze response quality and extract CAR/REST structure
+        follow_up_strategy, car_experience, rest_metrics = await self._analyze_turn(session, user_input)
         
         # Store experience
         experience = WorkExperienceData(
@@ -413,9 +473,7 @@ Tell me about your most significant professional achievement. I want to understa
         )
         
         # Update profile
-        current_experiences = profile.work_experiences or []
-        current_experiences.append(experience.dict())
-        profile.work_experiences = current_experiences
+        current_experiences = self._append_work_experience(profile, experience)
         
         # Determine response based on follow-up strategy
         if follow_up_strategy == FollowUpStrategy.PROCEED:
@@ -437,7 +495,7 @@ What's another proud moment in your career?"""
             progress = 50.0
         else:
             # Stay in story discovery with follow-up
-            follow_ups = self.follow_up_templates.get(follow_up_strategy, [])
+            follow_ups = self.follow_up_templates.get(follow_up_strategy, ())
             selected_follow_up = follow_ups[0] if follow_ups else "Can you provide more specific details?"
             
             response_message = f"""{selected_follow_up}
@@ -453,7 +511,7 @@ Can you enhance this with specific numbers, percentages, or measurable outcomes?
 
             progress = 35.0
         
-        return ConversationResponse(
+        return ConversationResponse.model_construct(
             message=response_message,
             phase=session.current_phase,
             follow_up_strategy=follow_up_strategy,
@@ -466,8 +524,7 @@ Can you enhance this with specific numbers, percentages, or measurable outcomes?
         """Process achievement mining phase"""
         
         # Extract additional experience
-        car_experience = self.rocket_framework.extract_car_structure(user_input)
-        rest_metrics = self.rocket_framework.extract_rest_metrics(user_input)
+        _, car_experience, rest_metrics = await self._analyze_turn(session, user_input)
         
         experience = WorkExperienceData(
             car_structure=car_experience,
@@ -475,53 +532,38 @@ Can you enhance this with specific numbers, percentages, or measurable outcomes?
         )
         
         # Update profile
-        current_experiences = profile.work_experiences or []
-        current_experiences.append(experience.dict())
-        profile.work_experiences = current_experiences
+        current_experiences = self._append_work_experience(profile, experience)
         
         # Check if we have enough experiences
         if len(current_experiences) >= 3:
             # Move to synthesis
             session.current_phase = ConversationPhase.SYNTHESIS
             
-            # Generate personal story
-            user_messages = self.db.query(ConversationMessage).filter(
-                ConversationMessage.session_id == session_id,
-                ConversationMessage.sender == "user"
-            ).all()
-            all_responses = [msg.message for msg in user_messages]
-            personal_story = self.rocket_framework.analyze_personal_story(all_responses)
+            all_responses = self._get_user_messages(session)
+            
+            # Only the first four experiences feed the summary, and this turn's
+            # experience is reused as-is rather than re-validated from its dict
+            experiences_obj = [WorkExperienceData(**exp) for exp in current_experiences[:-1][:4]]
+            experiences_obj.append(experience)
             
-            # Build resume summary
-            experiences_obj = [WorkExperienceData(**exp) for exp in current_experiences]
-            resume_summary = self.rocket_framework.build_resume_summary(personal_story, experiences_obj)
+            # Generate personal story and build resume summary off the event loop
+            personal_story, resume_summary = await asyncio.to_thread(
+                self._run_synthesis, all_responses, experiences_obj
+            )
             
             # Update profile
             profile.personal_story = personal_story.story_statement
             profile.resume_summary_bullets = resume_summary.bullets
             profile.story_coherence_score = personal_story.coherence_score
             
-            response_message = f"""🚀 **ROCKET Launch Complete, {profile.name}!**
-
-I now have rich material to create your bulletproof resume. Based on our conversation, I can see you're a {personal_story.role_identity or 'strategic professional'} with unique strengths.
-
-**Your ROCKET-Powered Resume Summary:**
-**{resume_summary.title}**
-
-{chr(10).join(f"• {bullet}" for bullet in resume_summary.bullets)}
-
-**ROCKET Framework Scores:**
-- Story Coherence: {personal_story.coherence_score:.1%}
-- Achievement Quantification: {self._calculate_quantification_score(current_experiences):.1%}
-
-Your resume is now optimized using the ROCKET Framework! 🚀
-
-**Next Steps:**
-1. Review and refine any bullets above
-2. Add skills and education details
-3. Export your final resume
-
-Is there anything you'd like to adjust in your resume summary?"""
+            response_message = _SYNTHESIS_MESSAGE_TEMPLATE.format_map({
+                "name": profile.name,
+                "role_identity": personal_story.role_identity or 'strategic professional',
+                "title": resume_summary.title,
+                "bullets": "\n".join(f"• {bullet}" for bullet in resume_summary.bullets),
+                "coherence_score": personal_story.coherence_score,
+                "quantification_score": self._calculate_quantification_score(current_experiences),
+            })
 
             progress = 90.0
         else:
@@ -542,7 +584,7 @@ What's another example that showcases your unique value?
 
             progress = 70.0
         
-        return ConversationResponse(
+        return ConversationResponse.model_construct(
             message=response_message,
             phase=session.current_phase,
             progress_percentage=progress,
@@ -577,13 +619,68 @@ Thank you for using the ROCKET Framework - Results-Optimized Career Knowledge En
         # Mark session as completed
         session.completed_at = datetime.utcnow()
         
-        return ConversationResponse(
+        return ConversationResponse.model_construct(
             message=response_message,
             phase=ConversationPhase.REVIEW,
             progress_percentage=100.0,
             session_id=session.id
         )
     
+    def _append_work_experience(self, profile: UserCareerProfile,
+                                experience: WorkExperienceData) -> List[Dict[str, Any]]:
+        """Append an experience to the profile's stored work experiences"""
+        # Assign a new list: mutating the loaded JSON list in place leaves the
+        # committed value equal to the new one, so no UPDATE would be issued
+        experiences = [*(profile.work_experiences or []), experience.dict()]
+        profile.work_experiences = experiences
+        return experiences
+    
+    def _record_user_message(self, session: ConversationSession, user_input: str) -> None:
+        """Accumulate user turns on the session state so synthesis needs no message query"""
+        state = session.conversation_state or {}
+        if "user_messages" not in state:
+            # Session predates the accumulator; synthesis falls back to the message table
+            return
+        # Reassign so SQLAlchemy detects the JSON change
+        session.conversation_state = {**state, "user_messages": state["user_messages"] + [user_input]}
+    
+    def _get_user_messages(self, session: ConversationSession) -> List[str]:
+        """Return all user turns for the session, including the one being processed"""
+        state = session.conversation_state or {}
+        if "user_messages" in state:
+            return state["user_messages"]
+        # SessionLocal disables autoflush; flush so the pending user turn is included
+        self.db.flush()
+        return [message for (message,) in self.db.query(ConversationMessage.message).filter(
+            ConversationMessage.session_id == session.id,
+            ConversationMessage.sender == "user"
+        ).yield_per(256)]
+    
+    async def _analyze_turn(self, session: ConversationSession,
+                            user_input: str) -> Tuple[FollowUpStrategy, CARExperience, RESTMetrics]:
+        """Run follow-up analysis and CAR/REST extraction, reusing cached results for repeated inputs"""
+        cache_key = TurnAnalysisCache.make_key(session.current_phase.value, user_input)
+        analysis = _turn_analysis_cache.get(cache_key)
+        if analysis is None:
+            # One worker-thread hop for the whole batch keeps the event loop free
+            analysis = await asyncio.to_thread(self._run_turn_analysis, user_input)
+            _turn_analysis_cache.set(cache_key, analysis)
+        return analysis
+    
+    def _run_turn_analysis(self, user_input: str) -> Tuple[FollowUpStrategy, CARExperience, RESTMetrics]:
+        """Synchronous follow-up analysis and CAR/REST extraction for one user turn"""
+        return (
+            self.follow_up_system.analyze_response_quality(user_input),
+            self.rocket_framework.extract_car_structure(user_input),
+            self.rocket_framework.extract_rest_metrics(user_input),
+        )
+    
+    def _run_synthesis(self, all_responses: List[str],
+                       experiences: List[WorkExperienceData]) -> Tuple[PersonalStory, ResumeSummary]:
+        """Synchronous personal story analysis and resume summary build"""
+        personal_story = self.rocket_framework.analyze_personal_story(all_responses)
+        return personal_story, self.rocket_framework.build_resume_summary(personal_story, experiences)
+    
     def _extract_name(self, message: str) -> Optional[str]:
         """Extract name from user message"""
         name_patterns = [
@@ -599,21 +696,11 @@ Thank you for using the ROCKET Framework - Results-Optimized Career Knowledge En
         return None
     
     def _extract_role(self, message: str) -> Optional[str]:
-        """Extract target role from user message"""
-        roles = {
-            'software engineer': 'Software Engineer',
-            'product manager': 'Product Manager',
-            'data scientist': 'Data Scientist',
-            'marketing manager': 'Marketing Manager',
-            'business analyst': 'Business Analyst',
-            'project manager': 'Project Manager',
-            'consultant': 'Consultant',
-            'designer': 'Designer',
-            'developer': 'Developer'
-        }
-        
+        """Extract target role from user message, preferring the longest keyword match"""
         message_lower = message.lower()
-        for key, value in roles.items():
+        if len(message_lower) < _MIN_TARGET_ROLE_LENGTH:
+            return None
+        for key, value in _TARGET_ROLES_SORTED:
             if key in message_lower:
                 return value
         return None
@@ -1,126 +1,130 @@
-from typing import Optional
+from typing import ClassVar, Optional
 
 
-class ResumeNotFoundError(Exception):
+class _TemplatedError(Exception):
+    """
+    Base for service errors whose default message comes from class-level templates.
+    """
+
+    id_message: ClassVar[str] = ""
+    default_message: ClassVar[str] = ""
+
+    def __init__(self, identifier: Optional[str] = None, message: Optional[str] = None):
+        if not message:
+            message = self.id_message.format(id=identifier) if identifier else self.default_message
+        super().__init__(message)
+
+
+class ResumeNotFoundError(_TemplatedError):
     """
     Exception raised when a resume is not found in the database.
     """
 
+    id_message = "Resume with ID {id} not found."
+    default_message = "Resume not found."
+
     def __init__(self, resume_id: Optional[str] = None, message: Optional[str] = None):
-        if resume_id and not message:
-            message = f"Resume with ID {resume_id} not found."
-        elif not message:
-            message = "Resume not found."
-        super().__init__(message)
+        super().__init__(resume_id, message)
         self.resume_id = resume_id
 
 
-class JobNotFoundError(Exception):
+class JobNotFoundError(_TemplatedError):
     """
     Exception raised when a job is not found in the database.
     """
 
+    id_message = "Job with ID {id} not found."
+    default_message = "Job not found."
+
     def __init__(self, job_id: Optional[str] = None, message: Optional[str] = None):
-        if job_id and not message:
-            message = f"Job with ID {job_id} not found."
-        elif not message:
-            message = "Job not found."
-        super().__init__(message)
+        super().__init__(job_id, message)
         self.job_id = job_id
 
 
-class ResumeValidationError(Exception):
+class ResumeValidationError(_TemplatedError):
     """
     Exception raised when structured resume validation fails.
     """
 
+    id_message = "Resume with ID {id} failed validation during structured parsing."
+    default_message = "Resume validation failed during structured parsing."
+    validation_message: ClassVar[str] = "Resume parsing failed: {error}. Please ensure your resume contains all required information with proper formatting."
+
     def __init__(
         self,
         resume_id: Optional[str] = None,
         validation_error: Optional[str] = None,
         message: Optional[str] = None,
     ):
-        if message:
-            # we can use custom message if provided
-            pass
-        elif validation_error:
-            message = f"Resume parsing failed: {validation_error}. Please ensure your resume contains all required information with proper formatting."
-        elif resume_id:
-            message = f"Resume with ID {resume_id} failed validation during structured parsing."
-        else:
-            message = "Resume validation failed during structured parsing."
-        super().__init__(message)
+        if not message and validation_error:
+            message = self.validation_message.format(error=validation_error)
+        super().__init__(resume_id, message)
         self.resume_id = resume_id
         self.validation_error = validation_error
 
 
-class ResumeParsingError(Exception):
+class ResumeParsingError(_TemplatedError):
     """
     Exception raised when a resume processing and storing in the database failed.
     """
 
+    id_message = "Parsing of resume with ID {id} failed."
+    default_message = "Parsed resume not found."
+
     def __init__(self, resume_id: Optional[str] = None, message: Optional[str] = None):
-        if resume_id and not message:
-            message = f"Parsing of resume with ID {resume_id} failed."
-        elif not message:
-            message = "Parsed resume not found."
-        super().__init__(message)
+        super().__init__(resume_id, message)
         self.resume_id = resume_id
 
 
-class JobParsingError(Exception):
+class JobParsingError(_TemplatedError):
     """
     Exception raised when a resume processing and storing in the database failed.
     """
 
+    id_message = "Parsing of job with ID {id} failed."
+    default_message = "Parsed job not found."
+
     def __init__(self, job_id: Optional[str] = None, message: Optional[str] = None):
-        if job_id and not message:
-            message = f"Parsing of job with ID {job_id} failed."
-        elif not message:
-            message = "Parsed job not found."
-        super().__init__(message)
+        super().__init__(job_id, message)
         self.job_id = job_id
 
 
-class ResumeKeywordExtractionError(Exception):
+class ResumeKeywordExtractionError(_TemplatedError):
     """
     Exception raised when keyword extraction from resume failed or no keywords were extracted.
     """
 
+    id_message = "Keyword extraction failed for resume with ID {id}. Cannot proceed with resume improvement without extracted keywords."
+    default_message = "Resume keyword extraction failed. Cannot improve resume without keywords."
+
     def __init__(self, resume_id: Optional[str] = None, message: Optional[str] = None):
-        if resume_id and not message:
-            message = f"Keyword extraction failed for resume with ID {resume_id}. Cannot proceed with resume improvement without extracted keywords."
-        elif not message:
-            message = "Resume keyword extraction failed. Cannot improve resume without keywords."
-        super().__init__(message)
+        super().__init__(resume_id, message)
         self.resume_id = resume_id
 
 
-class JobKeywordExtractionError(Exception):
+class JobKeywordExtractionError(_TemplatedError):
     """
     Exception raised when keyword extraction from job failed or no keywords were extracted.
     """
 
+    id_message = "Keyword extraction failed for job with ID {id}. Cannot proceed with resume improvement without job keywords."
+    default_message = "Job keyword extraction failed. Cannot improve resume without job requirements."
+
     def __init__(self, job_id: Optional[str] = None, message: Optional[str] = None):
-        if job_id and not message:
-            message = f"Keyword extraction failed for job with ID {job_id}. Cannot proceed with resume improvement without job keywords."
-        elif not message:
-            message = "Job keyword extraction failed. Cannot improve resume without job requirements."
-        super().__init__(message)
+        super().__init__(job_id, message)
         self.job_id = job_id
 
 
-class EliteComparisonError(Exception):
+class EliteComparisonError(_TemplatedError):
     """
     Exception raised when elite comparison analysis fails.
     """
 
+    id_message = "Elite comparison failed for resume with ID {id}."
+    default_message = "Elite comparison analysis failed."
+
     def __init__(self, message: Optional[str] = None, resume_id: Optional[str] = None):
-        if resume_id and not message:
-            message = f"Elite comparison failed for resume with ID {resume_id}."
-        elif not message:
-            message = "Elite comparison analysis failed."
-        super().__init__(message)
+        super().__init__(resume_id, message)
         self.resume_id = resume_id
 
 
@@ -3,51 +3,100 @@ ROCKET Framework - Multi-Persona Session Management
 Orchestrates conversations between different AI personas for comprehensive career coaching
 """
 
+import time
 import uuid
-from typing import Dict, List, Any, Optional, Tuple
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import ClassVar, Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import flag_modified
 
 from ..models.personas import PersonaProfile, PersonaSession, PersonaInsight, PersonaCrossAnalysis, PersonaType
 from ..models.conversation import ConversationSession
-from .persona_definitions import PersonaDefinitions, PersonaSelector
+from .persona_definitions import Persona, PersonaDefinitions, PersonaSelector
 from .conversation_service import ROCKETFramework
 from ..core import get_sync_db_session
 
 
+@dataclass(frozen=True, slots=True)
+class _PersonaDerived:
+    """Per-persona values the turn handlers would otherwise recompute on every call"""
+    focus_keywords: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    welcome_prefix: str
+    welcome_suffix: str
+    communication_style_lower: str
+
+
+def _derive(persona: Persona) -> _PersonaDerived:
+    return _PersonaDerived(
+        focus_keywords=tuple(
+            (area, tuple(area.lower().split())) for area in persona.analysis_focus
+        ),
+        # Welcome message split around the session-specific objectives
+        welcome_prefix=(
+            f"Hello! I'm {persona.name}, your {persona.title}. \n        \n"
+            f"I specialize in {', '.join(persona.expertise_areas[:3])} and I'm here to help you with:\n"
+        ),
+        welcome_suffix=(
+            f"\n\n{persona.personality_traits['approach']}\n\n"
+            "Let's begin with a question that will help me understand your current situation better:\n\n"
+            f"{persona.question_templates['opening'][0]}"
+        ),
+        communication_style_lower=persona.personality_traits["communication_style"].lower()
+    )
+
+
+# persona_type -> derived values, built once at import alongside the definitions
+_PERSONA_DERIVED: Dict[str, _PersonaDerived] = {
+    persona_type: _derive(persona)
+    for persona_type, persona in PersonaDefinitions.get_all_personas().items()
+}
+
+
 class PersonaSessionManager:
     """Manages multi-persona career coaching sessions"""
     
+    # persona_type -> (profile id, name, title). Profiles are only written by
+    # initialize_personas, so the mapping is shared across managers.
+    _profile_cache: ClassVar[Dict[str, Tuple[str, str, str]]] = {}
+    _profile_cache_loaded_at: ClassVar[float] = 0.0
+    PROFILE_CACHE_TTL: ClassVar[float] = 3600.0
+    
     def __init__(self, db: Session):
         self.db = db
-        self.persona_definitions = PersonaDefinitions.get_all_personas()
         self.rocket_framework = ROCKETFramework()
         
     def initialize_personas(self) -> bool:
         """Initialize persona profiles in database if they don't exist"""
         try:
-            for persona_type, definition in self.persona_definitions.items():
-                # Check if persona already exists
-                existing = self.db.query(PersonaProfile).filter(
-                    PersonaProfile.persona_type == persona_type
-                ).first()
-                
-                if not existing:
-                    persona_profile = PersonaProfile(
-                        id=str(uuid.uuid4()),
-                        persona_type=persona_type,
-                        name=definition["name"],
-                        title=definition["title"],
-                        expertise_areas=definition["expertise_areas"],
-                        conversation_style=definition["conversation_style"],
-                        question_templates=definition["question_templates"],
-                        analysis_focus=definition["analysis_focus"],
-                        personality_traits=definition["personality_traits"],
-                        success_metrics=definition["success_metrics"]
-                    )
-                    self.db.add(persona_profile)
+            # One query for the types already present, one bulk INSERT for the rest
+            existing_types = {
+                persona_type for (persona_type,) in self.db.query(PersonaProfile.persona_type).all()
+            }
+            
+            new_profiles = []
+            for persona_type, persona in PersonaDefinitions.get_all_personas().items():
+                if persona_type not in existing_types:
+                    definition = persona.as_dict()
+                    new_profiles.append({
+                        "id": str(uuid.uuid4()),
+                        "persona_type": persona_type,
+                        "name": definition["name"],
+                        "title": definition["title"],
+                        "expertise_areas": definition["expertise_areas"],
+                        "conversation_style": definition["conversation_style"],
+                        "question_templates": definition["question_templates"],
+                        "analysis_focus": definition["analysis_focus"],
+                        "personality_traits": definition["personality_traits"],
+                        "success_metrics": definition["success_metrics"]
+                    })
+            
+            if new_profiles:
+                self.db.bulk_insert_mappings(PersonaProfile, new_profiles)
             
             self.db.commit()
+            PersonaSessionManager._profile_cache = {}
             return True
             
         except Exception as e:
@@ -59,22 +108,32 @@ class PersonaSessionManager:
         """Recommend optimal personas based on user profile"""
         recommended_types = PersonaSelector.recommend_personas(user_goals, career_stage, challenges)
         
+        if not recommended_types:
+            return []
+
+        # One query for all recommended profile ids, keyed by type
+        profile_ids_by_type = dict(
+            self.db.query(PersonaProfile).with_entities(
+                PersonaProfile.persona_type, PersonaProfile.id
+            ).filter(
+                PersonaProfile.persona_type.in_(recommended_types)
+            ).all()
+        )
+
         recommendations = []
         for persona_type in recommended_types:
-            persona_profile = self.db.query(PersonaProfile).filter(
-                PersonaProfile.persona_type == persona_type
-            ).first()
-            
-            if persona_profile:
-                definition = self.persona_definitions[persona_type]
+            profile_id = profile_ids_by_type.get(persona_type)
+
+            if profile_id:
+                persona = PersonaDefinitions.get_persona(persona_type)
                 recommendations.append({
-                    "id": persona_profile.id,
+                    "id": profile_id,
                     "persona_type": persona_type,
-                    "name": definition["name"],
-                    "title": definition["title"],
-                    "expertise_areas": definition["expertise_areas"],
-                    "session_objectives": definition["session_objectives"],
-                    "personality_traits": definition["personality_traits"]
+                    "name": persona.name,
+                    "title": persona.title,
+                    "expertise_areas": persona.expertise_areas,
+                    "session_objectives": persona.session_objectives,
+                    "personality_traits": dict(persona.personality_traits)
                 })
         
         return recommendations
@@ -89,19 +148,18 @@ class PersonaSessionManager:
         """Start a new persona-specific session"""
         try:
             # Get persona profile
-            persona_profile = self.db.query(PersonaProfile).filter(
-                PersonaProfile.persona_type == persona_type
-            ).first()
+            persona_profile = self._get_profile_summary(persona_type)
             
             if not persona_profile:
                 return False, "Persona not found", {}
+            profile_id, profile_name, profile_title = persona_profile
             
             # Create persona session
             session_id = str(uuid.uuid4())
             persona_session = PersonaSession(
                 id=session_id,
                 user_id=user_id,
-                persona_id=persona_profile.id,
+                persona_id=profile_id,
                 conversation_session_id=conversation_session_id,
                 session_objectives=session_objectives,
                 current_phase="introduction",
@@ -114,13 +172,13 @@ class PersonaSessionManager:
             self.db.commit()
             
             # Generate welcome message
-            welcome_message = self._generate_welcome_message(persona_profile, session_objectives)
+            welcome_message = self._generate_welcome_message(persona_type, session_objectives)
             
             return True, session_id, {
                 "session_id": session_id,
                 "persona": {
-                    "name": persona_profile.name,
-                    "title": persona_profile.title,
+                    "name": profile_name,
+                    "title": profile_title,
                     "persona_type": persona_type
                 },
                 "welcome_message": welcome_message,
@@ -140,7 +198,9 @@ class PersonaSessionManager:
         """Process user response within persona context"""
         try:
             # Get persona session
-            persona_session = self.db.query(PersonaSession).filter(
+            persona_session = self.db.query(PersonaSession).options(
+                joinedload(PersonaSession.persona_profile)
+            ).filter(
                 PersonaSession.id == session_id
             ).first()
             
@@ -151,37 +211,46 @@ class PersonaSessionManager:
                 return False, "Persona session is not active", {}
             
             # Get persona definition
-            persona_definition = self.persona_definitions.get(persona_session.persona_profile.persona_type)
+            persona_definition = PersonaDefinitions.get_persona(persona_session.persona_profile.persona_type)
             if not persona_definition:
                 return False, "Persona definition not found", {}
             
+            # The turn helpers only need the history length
+            turn_count = len(persona_session.conversation_history or [])
+            
             # Process response using persona-specific logic
             ai_response, insights, next_phase = self._process_persona_interaction(
                 persona_definition,
-                persona_session,
+                persona_session.current_phase,
+                turn_count,
                 user_response
             )
             
-            # Update conversation history
-            conversation_history = persona_session.conversation_history or []
-            conversation_history.extend([
+            # Update conversation history in place; flag_modified tells SQLAlchemy
+            # the JSON column changed, since in-place mutation is not tracked
+            timestamp = datetime.utcnow().isoformat()
+            turn_entries = (
                 {
                     "type": "user",
                     "content": user_response,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": timestamp
                 },
                 {
                     "type": "assistant",
                     "content": ai_response,
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "phase": persona_session.current_phase
                 }
-            ])
+            )
+            if persona_session.conversation_history is None:
+                persona_session.conversation_history = list(turn_entries)
+            else:
+                persona_session.conversation_history.extend(turn_entries)
+                flag_modified(persona_session, "conversation_history")
             
             # Update session
-            persona_session.conversation_history = conversation_history
             persona_session.current_phase = next_phase
-            persona_session.progress_percentage = self._calculate_progress(conversation_history, next_phase)
+            persona_session.progress_percentage = self._calculate_progress(turn_count + 2, next_phase)
             
             # Store insights if generated
             if insights:
@@ -204,7 +273,9 @@ class PersonaSessionManager:
     def get_persona_session_status(self, session_id: str) -> Tuple[bool, str, Dict[str, Any]]:
         """Get current status of persona session"""
         try:
-            persona_session = self.db.query(PersonaSession).filter(
+            persona_session = self.db.query(PersonaSession).options(
+                joinedload(PersonaSession.persona_profile)
+            ).filter(
                 PersonaSession.id == session_id
             ).first()
             
@@ -279,8 +350,14 @@ class PersonaSessionManager:
     def generate_cross_persona_analysis(self, user_id: str, session_ids: List[str]) -> Tuple[bool, str, Dict[str, Any]]:
         """Generate comprehensive analysis across multiple persona sessions"""
         try:
-            # Get all persona sessions
-            persona_sessions = self.db.query(PersonaSession).filter(
+            if len(set(session_ids)) < 2:
+                return False, "Need at least 2 completed persona sessions for cross-analysis", {}
+            
+            # Get all persona sessions with their profiles in the same statement
+            # (many-to-one, so the join adds no duplicate rows)
+            persona_sessions = self.db.query(PersonaSession).options(
+                joinedload(PersonaSession.persona_profile)
+            ).filter(
                 PersonaSession.id.in_(session_ids),
                 PersonaSession.user_id == user_id,
                 PersonaSession.status == "completed"
@@ -289,13 +366,10 @@ class PersonaSessionManager:
             if len(persona_sessions) < 2:
                 return False, "Need at least 2 completed persona sessions for cross-analysis", {}
             
-            # Gather insights from all sessions
-            all_insights = []
-            for session in persona_sessions:
-                session_insights = self.db.query(PersonaInsight).filter(
-                    PersonaInsight.persona_session_id == session.id
-                ).all()
-                all_insights.extend(session_insights)
+            # Gather insights from all sessions in one query
+            all_insights = self.db.query(PersonaInsight).filter(
+                PersonaInsight.persona_session_id.in_([session.id for session in persona_sessions])
+            ).all()
             
             # Perform cross-analysis
             cross_analysis = self._perform_cross_persona_analysis(persona_sessions, all_insights)
@@ -330,34 +404,43 @@ class PersonaSessionManager:
             self.db.rollback()
             return False, f"Error generating cross-persona analysis: {str(e)}", {}
     
-    def _generate_welcome_message(self, persona_profile: PersonaProfile, objectives: List[str]) -> str:
+    def _get_profile_summary(self, persona_type: str) -> Optional[Tuple[str, str, str]]:
+        """Return (id, name, title) of a persona profile, cached by persona type"""
+        cls = PersonaSessionManager
+        if not cls._profile_cache or time.monotonic() - cls._profile_cache_loaded_at > cls.PROFILE_CACHE_TTL:
+            cls._profile_cache = {
+                row.persona_type: (row.id, row.name, row.title)
+                for row in self.db.query(
+                    PersonaProfile.persona_type, PersonaProfile.id, PersonaProfile.name, PersonaProfile.title
+                ).all()
+            }
+            cls._profile_cache_loaded_at = time.monotonic()
+        
+        summary = cls._profile_cache.get(persona_type)
+        if summary is None:
+            # Fall back to the database for profiles added since the cache was loaded
+            row = self.db.query(
+                PersonaProfile.id, PersonaProfile.name, PersonaProfile.title
+            ).filter(PersonaProfile.persona_type == persona_type).first()
+            if row:
+                summary = (row.id, row.name, row.title)
+                cls._profile_cache[persona_type] = summary
+        return summary
+    
+    def _generate_welcome_message(self, persona_type: str, objectives: List[str]) -> str:
         """Generate personalized welcome message for persona"""
-        definition = self.persona_definitions[persona_profile.persona_type]
-        
-        welcome_template = f"""Hello! I'm {definition['name']}, your {definition['title']}. 
-        
-I specialize in {', '.join(definition['expertise_areas'][:3])} and I'm here to help you with:
-{chr(10).join(f'• {obj}' for obj in objectives[:3])}
-
-{definition['personality_traits']['approach']}
-
-Let's begin with a question that will help me understand your current situation better:
-
-{definition['question_templates']['opening'][0]}"""
-        
-        return welcome_template
+        derived = _PERSONA_DERIVED[persona_type]
+        return derived.welcome_prefix + "\n".join(f"• {obj}" for obj in objectives[:3]) + derived.welcome_suffix
     
     def _process_persona_interaction(
         self, 
-        persona_definition: Dict[str, Any], 
-        persona_session: PersonaSession, 
+        persona_definition: Persona, 
+        current_phase: str, 
+        conversation_length: int, 
         user_response: str
     ) -> Tuple[str, List[Dict[str, Any]], str]:
         """Process interaction using persona-specific logic"""
         
-        current_phase = persona_session.current_phase
-        conversation_history = persona_session.conversation_history or []
-        
         # Analyze response quality and extract insights
         response_analysis = self._analyze_persona_response(
             user_response, 
@@ -378,14 +461,14 @@ Let's begin with a question that will help me understand your current situation
             user_response,
             response_analysis,
             current_phase,
-            len(conversation_history)
+            conversation_length
         )
         
         # Determine next phase
         next_phase = self._determine_next_phase(
             current_phase, 
             response_analysis, 
-            len(conversation_history)
+            conversation_length
         )
         
         return ai_response, insights, next_phase
@@ -393,7 +476,7 @@ Let's begin with a question that will help me understand your current situation
     def _analyze_persona_response(
         self, 
         response: str, 
-        persona_definition: Dict[str, Any], 
+        persona_definition: Persona, 
         current_phase: str
     ) -> Dict[str, Any]:
         """Analyze user response from persona-specific perspective"""
@@ -406,17 +489,22 @@ Let's begin with a question that will help me understand your current situation
             "key_themes": [],
             "next_probe_areas": []
         }
-        
+
+        # Empty or near-empty replies score zero on every dimension
+        if len(response.strip()) < 5:
+            return analysis
+
         # Basic quality scoring
         if len(response) > 50:
             analysis["confidence_score"] += 0.3
         if len(response) > 150:
             analysis["confidence_score"] += 0.2
         
+        response_lower = response.lower()
+        
         # Look for persona-specific indicators
-        focus_areas = persona_definition["analysis_focus"]
-        for area in focus_areas:
-            if any(keyword in response.lower() for keyword in area.lower().split()):
+        for area, keywords in _PERSONA_DERIVED[persona_definition.persona_type].focus_keywords:
+            if any(keyword in response_lower for keyword in keywords):
                 analysis["relevance_score"] += 0.1
                 analysis["key_themes"].append(area)
         
@@ -425,7 +513,7 @@ Let's begin with a question that will help me understand your current situation
             if len(response) > 100:
                 analysis["depth_score"] = 0.7
         elif current_phase == "deep_dive":
-            if "because" in response.lower() or "resulted in" in response.lower():
+            if "because" in response_lower or "resulted in" in response_lower:
                 analysis["depth_score"] = 0.8
         
         # Normalize scores
@@ -437,20 +525,27 @@ Let's begin with a question that will help me understand your current situation
     def _extract_persona_insights(
         self, 
         response: str, 
-        persona_definition: Dict[str, Any], 
+        persona_definition: Persona, 
         analysis: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """Extract insights based on persona-specific focus areas"""
         
         insights = []
+        if not analysis["key_themes"]:
+            return insights
+        
+        # The evidence excerpt is the same for every theme in this response
+        evidence = response[:200] + "..." if len(response) > 200 else response
+        confidence = analysis["confidence_score"]
         
         for theme in analysis["key_themes"]:
+            theme_lower = theme.lower()
             insight = {
-                "category": theme.lower().replace(" ", "_"),
+                "category": theme_lower.replace(" ", "_"),
                 "title": f"{theme} Assessment",
-                "description": f"User demonstrates awareness in {theme.lower()}",
-                "confidence": analysis["confidence_score"],
-                "supporting_evidence": [response[:200] + "..." if len(response) > 200 else response],
+                "description": f"User demonstrates awareness in {theme_lower}",
+                "confidence": confidence,
+                "supporting_evidence": [evidence],
                 "recommendations": []
             }
             insights.append(insight)
@@ -459,7 +554,7 @@ Let's begin with a question that will help me understand your current situation
     
     def _generate_persona_response(
         self, 
-        persona_definition: Dict[str, Any], 
+        persona_definition: Persona, 
         user_response: str, 
         analysis: Dict[str, Any], 
         current_phase: str, 
@@ -467,8 +562,8 @@ Let's begin with a question that will help me understand your current situation
     ) -> str:
         """Generate AI response in persona's voice and style"""
         
-        style = persona_definition["conversation_style"]
-        templates = persona_definition["question_templates"]
+        style = persona_definition.conversation_style
+        templates = persona_definition.question_templates
         
         # Choose appropriate response based on phase and analysis
         if current_phase == "introduction" and analysis["confidence_score"] > 0.6:
@@ -484,10 +579,10 @@ Let's begin with a question that will help me understand your current situation
             base_response = "Thank you for sharing that. Can you provide more specific details?"
         
         # Apply persona voice
-        persona_name = persona_definition["name"]
-        communication_style = persona_definition["personality_traits"]["communication_style"]
+        persona_name = persona_definition.name
+        communication_style = _PERSONA_DERIVED[persona_definition.persona_type].communication_style_lower
         
-        personalized_response = f"{base_response}\n\nAs someone who is {communication_style.lower()}, I'm particularly interested in understanding this better."
+        personalized_response = f"{base_response}\n\nAs someone who is {communication_style}, I'm particularly interested in understanding this better."
         
         return personalized_response
     
@@ -511,9 +606,9 @@ Let's begin with a question that will help me understand your current situation
         
         return current_phase
     
-    def _calculate_progress(self, conversation_history: List[Dict], current_phase: str) -> float:
+    def _calculate_progress(self, conversation_length: int, current_phase: str) -> float:
         """Calculate session progress percentage"""
-        base_progress = len(conversation_history) * 5  # 5% per exchange
+        base_progress = conversation_length * 5  # 5% per exchange
         
         phase_bonuses = {
             "introduction": 0,
@@ -526,46 +621,63 @@ Let's begin with a question that will help me understand your current situation
         return float(total_progress)
     
     def _store_persona_insights(self, session_id: str, insights: List[Dict[str, Any]]):
-        """Store generated insights in database"""
-        for insight_data in insights:
-            insight = PersonaInsight(
-                id=str(uuid.uuid4()),
-                persona_session_id=session_id,
-                insight_category=insight_data["category"],
-                insight_title=insight_data["title"],
-                insight_description=insight_data["description"],
-                confidence_score=insight_data["confidence"],
-                supporting_evidence=insight_data["supporting_evidence"],
-                actionable_recommendations=insight_data.get("recommendations", []),
-                priority_level="medium"
-            )
-            self.db.add(insight)
+        """Store generated insights in database (single bulk INSERT; caller commits)"""
+        self.db.bulk_insert_mappings(PersonaInsight, [
+            {
+                "id": str(uuid.uuid4()),
+                "persona_session_id": session_id,
+                "insight_category": insight_data["category"],
+                "insight_title": insight_data["title"],
+                "insight_description": insight_data["description"],
+                "confidence_score": insight_data["confidence"],
+                "supporting_evidence": insight_data["supporting_evidence"],
+                "actionable_recommendations": insight_data.get("recommendations", []),
+                "priority_level": "medium"
+            }
+            for insight_data in insights
+        ])
     
     def _generate_final_persona_analysis(self, persona_session: PersonaSession) -> Dict[str, Any]:
         """Generate comprehensive final analysis for completed session"""
         
-        # Get all insights for this session
-        insights = self.db.query(PersonaInsight).filter(
+        # Get all insights for this session, as plain column tuples
+        insights = self.db.query(PersonaInsight).with_entities(
+            PersonaInsight.insight_category,
+            PersonaInsight.insight_title,
+            PersonaInsight.insight_description,
+            PersonaInsight.confidence_score
+        ).filter(
             PersonaInsight.persona_session_id == persona_session.id
         ).all()
         
+        # Single pass over the insights for every derived list and aggregate
+        insight_summaries = []
+        recommendations = []
+        top_strength_areas = []
+        total_confidence = 0.0
+        for insight in insights:
+            confidence = insight.confidence_score
+            total_confidence += confidence
+            insight_summaries.append({
+                "title": insight.insight_title,
+                "category": insight.insight_category,
+                "description": insight.insight_description,
+                "confidence": confidence
+            })
+            if confidence > 0.7:
+                recommendations.append(
+                    f"Continue developing expertise in {insight.insight_category.replace('_', ' ')}"
+                )
+            if confidence > 0.8:
+                top_strength_areas.append(insight.insight_category)
+        
         analysis = {
-            "insights": [
-                {
-                    "title": insight.insight_title,
-                    "category": insight.insight_category,
-                    "description": insight.insight_description,
-                    "confidence": insight.confidence_score
-                } for insight in insights
-            ],
-            "recommendations": [
-                f"Continue developing expertise in {insight.insight_category.replace('_', ' ')}"
-                for insight in insights if insight.confidence_score > 0.7
-            ],
+            "insights": insight_summaries,
+            "recommendations": recommendations,
             "assessment_results": {
                 "total_insights_generated": len(insights),
-                "average_confidence": sum(i.confidence_score for i in insights) / len(insights) if insights else 0,
-                "top_strength_areas": [i.insight_category for i in insights if i.confidence_score > 0.8]
+                "average_confidence": total_confidence / len(insights) if insights else 0,
+                "top_strength_areas": top_strength_areas
             }
         }
         
@@ -578,26 +690,28 @@ Let's begin with a question that will help me understand your current situation
     ) -> Dict[str, Any]:
         """Perform comprehensive cross-persona analysis"""
         
-        # Group insights by category
-        insight_categories = {}
+        # Single pass: per-category counts, low-confidence categories and total confidence
+        insight_categories = defaultdict(int)
+        low_confidence_categories = set()
+        total_confidence = 0.0
         for insight in all_insights:
             category = insight.insight_category
-            if category not in insight_categories:
-                insight_categories[category] = []
-            insight_categories[category].append(insight)
+            insight_categories[category] += 1
+            if insight.confidence_score < 0.6:
+                low_confidence_categories.add(category)
+            total_confidence += insight.confidence_score
         
         # Find consistent themes across personas
         consistent_themes = [
-            category for category, insights in insight_categories.items()
-            if len(insights) >= 2  # Mentioned by at least 2 personas
+            category for category, count in insight_categories.items()
+            if count >= 2  # Mentioned by at least 2 personas
         ]
         
         # Generate comprehensive profile
         comprehensive_profile = {
             "primary_strengths": consistent_themes[:3],
             "development_areas": [
-                category for category, insights in insight_categories.items()
-                if any(i.confidence_score < 0.6 for i in insights)
+                category for category in insight_categories if category in low_confidence_categories
             ],
             "persona_coverage": [session.persona_profile.persona_type for session in persona_sessions]
         }
@@ -622,7 +736,7 @@ Let's begin with a question that will help me understand your current situation
                 "insights_generated": len(all_insights),
                 "consistency_score": len(consistent_themes) / len(insight_categories) if insight_categories else 0
             },
-            "confidence_score": sum(i.confidence_score for i in all_insights) / len(all_insights) if all_insights else 0,
+            "confidence_score": total_confidence / len(all_insights) if all_insights else 0,
             "completeness_score": min(1.0, len(persona_sessions) / 3)  # More complete with more personas
         }
         
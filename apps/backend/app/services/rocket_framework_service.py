@@ -481,7 +481,8 @@ class ROCKETFrameworkService:
                 continue
                 
             # Calculate indicator score
-            indicator_score = sum(1 for indicator in indicators if indicator.lower() in sentence.lower())
+            sentence_lower = sentence.lower()
+            indicator_score = sum(1 for indicator in indicators if indicator.lower() in sentence_lower)
             
             # Normalize by sentence length and number of indicators
             if len(indicators) > 0:
@@ -826,17 +827,18 @@ class ROCKETFrameworkService:
         }
         
         # Extract key terms (simple keyword extraction)
-        words = user_response.lower().split()
+        response_lower = user_response.lower()
+        words = response_lower.split()
         
         # Filter out common words and extract meaningful terms
         stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were'}
         key_terms = [word for word in words if len(word) > 3 and word not in stop_words]
-        extracted['key_terms'] = list(set(key_terms))[:10]  # Top 10 unique terms
+        extracted['key_terms'] = list(dict.fromkeys(key_terms))[:10]  # Top 10 unique terms
         
         # Look for confidence indicators
         confidence_phrases = ['definitely', 'certainly', 'clearly', 'obviously', 'I think', 'maybe', 'perhaps', 'probably']
         for phrase in confidence_phrases:
-            if phrase in user_response.lower():
+            if phrase in response_lower:
                 extracted['confidence_indicators'].append(phrase)
         
         return extracted
@@ -476,7 +476,7 @@ Keep your response encouraging but focused on extracting concrete, quantifiable
         recommendations = []
         for persona_type, score in sorted_personas:
             if score > 0.1:  # Only recommend if some alignment
-                persona_def = PersonaDefinitions.get_all_personas().get(persona_type, {})
+                persona_def = PersonaDefinitions.get_persona_index().get(persona_type, {})
                 recommendations.append({
                     "persona_type": persona_type,
                     "name": persona_def.get("name", "Unknown"),
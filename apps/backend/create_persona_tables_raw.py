@@ -119,9 +119,25 @@ def create_persona_tables():
                     updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
                 )
             """))
-            
+
+            # Index the hot lookup paths: profile by type on every session
+            # start, insights by session (newest first) for status/analysis
+            print("🗂️  Creating ROCKET persona indexes...")
+            conn.execute(text(
+                "CREATE INDEX ix_rocket_persona_profiles_persona_type "
+                "ON rocket_persona_profiles (persona_type)"
+            ))
+            conn.execute(text(
+                "CREATE INDEX ix_rocket_persona_sessions_user_id_status "
+                "ON rocket_persona_sessions (user_id, status)"
+            ))
+            conn.execute(text(
+                "CREATE INDEX ix_rocket_persona_insights_session_created "
+                "ON rocket_persona_insights (persona_session_id, created_at DESC)"
+            ))
+
             conn.commit()
-        
+
         print("✅ Successfully created ROCKET persona tables:")
         print("   - rocket_persona_profiles")
         print("   - rocket_persona_sessions")
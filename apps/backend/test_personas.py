@@ -37,6 +37,7 @@ def test_persona_system():
             
             # Insert each persona
             for persona_type, definition in persona_definitions.items():
+                definition = definition.as_dict()
                 persona_id = str(uuid.uuid4())
                 conn.execute(text("""
                     INSERT INTO persona_profiles (
@@ -113,17 +114,17 @@ def test_persona_system():
         print("\n💬 Test 4: Testing Conversation Templates")
         exec_coach = persona_definitions["executive_coach"]
         print(f"Executive Coach Opening Question:")
-        print(f"  '{exec_coach['question_templates']['opening'][0]}'")
+        print(f"  '{exec_coach.question_templates['opening'][0]}'")
         
         life_coach = persona_definitions["life_coach"]
         print(f"Life Coach Opening Question:")
-        print(f"  '{life_coach['question_templates']['opening'][0]}'")
+        print(f"  '{life_coach.question_templates['opening'][0]}'")
         
         # Test 5: Test persona objectives
         print("\n🎯 Test 5: Testing Session Objectives")
         for persona_type, definition in list(persona_definitions.items())[:3]:
-            print(f"{definition['name']}:")
-            for i, objective in enumerate(definition['session_objectives'][:2], 1):
+            print(f"{definition.name}:")
+            for i, objective in enumerate(definition.session_objectives[:2], 1):
                 print(f"  {i}. {objective}")
         
         print("\n🎉 All Tests Passed! ROCKET Framework Multi-Persona System is Ready!")